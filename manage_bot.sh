@@ -58,6 +58,20 @@ status() {
     fi
 }
 
+dedupe() {
+    if [ -f "$PID_FILE" ]; then
+        PID=$(cat "$PID_FILE")
+        if ps -p $PID > /dev/null; then
+            echo "Bot is running (PID: $PID). Stop it before running dedupe."
+            return 1
+        fi
+    fi
+
+    echo "Removing duplicate log entries..."
+    cd "$SRC_DIR"
+    python3 data_manager.py dedupe
+}
+
 case "$1" in
     start)
         start
@@ -73,8 +87,11 @@ case "$1" in
     status)
         status
         ;;
+    dedupe)
+        dedupe
+        ;;
     *)
-        echo "Usage: $0 {start|stop|restart|status}"
+        echo "Usage: $0 {start|stop|restart|status|dedupe}"
         exit 1
         ;;
 esac
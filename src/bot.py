@@ -218,12 +218,13 @@ async def perform_save(update: Update, context: ContextTypes.DEFAULT_TYPE, overw
     
     if overwrite:
         overwrite_log(date_str, final_content)
-        action_msg = "덮어쓰기"
+        msg = f"✅ {date_str} 일지에 덮어쓰기 완료! (MD)"
     else:
-        save_log(date_str, final_content)
-        action_msg = "기록"
-    
-    msg = f"✅ {date_str} 일지에 {action_msg} 완료! (MD)"
+        written, _ = save_log(date_str, final_content)
+        if written:
+            msg = f"✅ {date_str} 일지에 기록 완료! (MD)"
+        else:
+            msg = f"ℹ️ {date_str} 일지에 방금(10분 이내) 저장한 것과 같은 기록이 있어 건너뛰었습니다."
     
     if query:
          await query.edit_message_text(msg)
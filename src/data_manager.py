@@ -1,6 +1,9 @@
 import os
 import re
-from datetime import datetime
+import json
+import glob
+import hashlib
+from datetime import datetime, timedelta
 
 # Markdown File Path
 import configparser
@@ -22,6 +25,19 @@ else:
 MASTER_FILE = os.path.join(DATA_DIR, 'workout_db.md')
 LOGS_DIR = os.path.join(DATA_DIR, 'logs')
 RECENT_FILE = os.path.join(DATA_DIR, 'recent_workouts.md')
+HASH_CACHE_FILE = os.path.join(DATA_DIR, '.entry_hashes.json')
+HASH_CACHE_DAYS = 7
+
+# A save identical to one made within this window is treated as a double tap / redelivery
+DUPLICATE_WINDOW = timedelta(minutes=10)
+
+# Every entry written by save_log/overwrite_log starts with a marker line:
+# "<!-- entry <fingerprint> <saved at> -->" (invisible when the Markdown is rendered)
+ENTRY_MARKER_PATTERN = re.compile(r'^<!-- entry ([0-9a-f]{16}) (\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}) -->\s*$')
+# Entry header written by the bot: "### [HH:MM:SS] 운동 부위: ..."
+# Only used to find entries written before markers existed.
+ENTRY_HEADER_PATTERN = re.compile(r'^### \[(\d{2}:\d{2}:\d{2})\] 운동 부위:')
+SECTION_HEADER_PATTERN = re.compile(r'^## (\d{4}-\d{2}-\d{2})')
 
 def get_monthly_file_path(date_str):
     """
@@ -36,16 +52,182 @@ def get_monthly_file_path(date_str):
         # Fallback if date format is weird, though shouldn't happen with valid inputs
         return os.path.join(LOGS_DIR, "unknown_date.md")
 
+def fingerprint_entry(content):
+    """
+    Returns a short hash of an entry: the bot header without its [HH:MM:SS] stamp
+    plus the user's text as-is (only blank lines and trailing spaces are ignored).
+    """
+    lines = []
+    for line in content.strip().splitlines():
+        line = line.rstrip()
+        if not line:
+            continue
+        if not lines and ENTRY_HEADER_PATTERN.match(line):
+            line = "### " + line.split("]", 1)[1].strip()
+        lines.append(line)
+    return hashlib.sha256("\n".join(lines).encode('utf-8')).hexdigest()[:16]
+
+def _mark_entry(content, entry_hash, saved_at):
+    return f"<!-- entry {entry_hash} {saved_at.strftime('%Y-%m-%dT%H:%M:%S')} -->\n{content}"
+
+def _file_signature(file_path):
+    """
+    Returns [mtime_ns, size] of a file, or None if it does not exist.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def _load_hash_cache():
+    """
+    Loads {'files': {path: signature}, 'dates': {date: {hash: saved_at}}}.
+    A date's hashes are those present in both the Master and its Monthly file.
+    """
+    empty = {'files': {}, 'dates': {}}
+    if not os.path.exists(HASH_CACHE_FILE):
+        return empty
+    try:
+        with open(HASH_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        # Corrupt cache is not fatal; dates get rescanned from the log files
+        return empty
+    if not isinstance(cache, dict) or 'files' not in cache or 'dates' not in cache:
+        return empty
+    return cache
+
+def _write_hash_cache(cache):
+    """
+    Writes the cache, keeping only the most recent HASH_CACHE_DAYS dates.
+    """
+    recent_dates = sorted(cache['dates'], reverse=True)[:HASH_CACHE_DAYS]
+    paths = {MASTER_FILE} | {get_monthly_file_path(date) for date in recent_dates}
+    data = {
+        'files': {path: sig for path, sig in cache['files'].items() if path in paths},
+        'dates': {date: cache['dates'][date] for date in recent_dates},
+    }
+    tmp_path = HASH_CACHE_FILE + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, HASH_CACHE_FILE)
+
+def _cached_entries(cache, date_str):
+    """
+    Returns the cached {hash: saved_at} for date_str, or None if the date is not cached
+    or the Master/Monthly file changed since the cache was written.
+    """
+    if date_str not in cache['dates']:
+        return None
+    for path in (MASTER_FILE, get_monthly_file_path(date_str)):
+        sig = _file_signature(path)
+        if sig is None or cache['files'].get(path) != sig:
+            return None
+    return cache['dates'][date_str]
+
+def _iter_entries(file_path):
+    """
+    Streams a log file and yields (date_str, lines, is_entry).
+    Entries start at a marker line, or at a bot header for entries written before markers.
+    Inside a marked entry only the next marker or section header ends it,
+    so headers pasted in the user's text never split an entry.
+    """
+    current_date = None
+    entry = None
+    entry_marked = False
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            section_match = SECTION_HEADER_PATTERN.match(line)
+            marker_match = ENTRY_MARKER_PATTERN.match(line)
+            legacy_header = not entry_marked and ENTRY_HEADER_PATTERN.match(line)
+            if section_match or marker_match or legacy_header:
+                if entry is not None:
+                    yield current_date, entry, True
+                    entry = None
+                    entry_marked = False
+                if section_match:
+                    current_date = section_match.group(1)
+                    yield current_date, [line], False
+                else:
+                    entry = [line]
+                    entry_marked = bool(marker_match)
+            elif entry is not None:
+                entry.append(line)
+            else:
+                yield current_date, [line], False
+    if entry is not None:
+        yield current_date, entry, True
+
+def _entry_key(lines, date_str):
+    """
+    Returns (fingerprint, saved_at) of an entry yielded by _iter_entries.
+    Unmarked entries are dated by their [HH:MM:SS] header on the section's date.
+    """
+    marker_match = ENTRY_MARKER_PATTERN.match(lines[0])
+    if marker_match:
+        return marker_match.group(1), datetime.strptime(marker_match.group(2), '%Y-%m-%dT%H:%M:%S')
+    header_match = ENTRY_HEADER_PATTERN.match(lines[0])
+    try:
+        saved_at = datetime.strptime(f"{date_str} {header_match.group(1)}", '%Y-%m-%d %H:%M:%S')
+    except (AttributeError, ValueError):
+        saved_at = None
+    return fingerprint_entry("".join(lines)), saved_at
+
+def _scan_entries(file_path, date_str):
+    """
+    Returns {hash: latest saved_at} for the entries under date_str in a log file.
+    """
+    entries = {}
+    if not os.path.exists(file_path):
+        return entries
+    for entry_date, lines, is_entry in _iter_entries(file_path):
+        if not is_entry or entry_date != date_str:
+            continue
+        entry_hash, saved_at = _entry_key(lines, date_str)
+        if saved_at is None:
+            continue
+        entries[entry_hash] = max(entries.get(entry_hash, saved_at), saved_at)
+    return entries
+
+def _is_repeat(entries, entry_hash, saved_at):
+    previous = entries.get(entry_hash)
+    return previous is not None and abs(saved_at - previous) <= DUPLICATE_WINDOW
+
 def save_log(date_str, content):
     """
     Wrapper to save log to Master file, Monthly file, and Recent file.
+    A save identical to one made within DUPLICATE_WINDOW (double tap, redelivered update)
+    is skipped for every file that already holds it.
+    Returns (written, success): written is False when the save was skipped as a duplicate.
     """
-    # 1. Save to Master
-    success_master = _save_to_file(MASTER_FILE, date_str, content, title="Iron Secretary Workout Log")
-    
-    # 2. Save to Monthly
+    now = datetime.now().replace(microsecond=0)
+    entry_hash = fingerprint_entry(content)
     monthly_file = get_monthly_file_path(date_str)
-    
+
+    cache = _load_hash_cache()
+    cached = _cached_entries(cache, date_str)
+    if cached is not None:
+        # Both files are unchanged since the last complete save
+        master_entries = {h: datetime.strptime(t, '%Y-%m-%dT%H:%M:%S') for h, t in cached.items()}
+        monthly_entries = master_entries
+    else:
+        # Check each file on its own, so a save that failed halfway is completed on retry
+        master_entries = _scan_entries(MASTER_FILE, date_str)
+        monthly_entries = _scan_entries(monthly_file, date_str)
+
+    in_master = _is_repeat(master_entries, entry_hash, now)
+    in_monthly = _is_repeat(monthly_entries, entry_hash, now)
+    if in_master and in_monthly:
+        return False, True
+
+    marked_content = _mark_entry(content, entry_hash, now)
+
+    # 1. Save to Recent Workouts (Rolling 7)
+    # Written first: it only replaces this date's entry, so repeating it on retry is harmless.
+    _update_recent_workouts(date_str, marked_content)
+
+    # 2. Save to Monthly
     # Ensure logs directory exists
     os.makedirs(os.path.dirname(monthly_file), exist_ok=True)
     
@@ -55,18 +237,41 @@ def save_log(date_str, content):
         month_title = f"Workout Log - {dt.strftime('%Y-%m')}"
     except:
         month_title = "Workout Log"
-        
-    success_monthly = _save_to_file(monthly_file, date_str, content, title=month_title)
-    
-    # 3. Save to Recent Workouts (Rolling 7)
-    _update_recent_workouts(date_str, content)
+
+    success_monthly = True
+    if not in_monthly:
+        success_monthly = _save_to_file(monthly_file, date_str, marked_content, title=month_title)
+
+    # 3. Save to Master
+    success_master = True
+    if not in_master:
+        success_master = _save_to_file(MASTER_FILE, date_str, marked_content, title="Iron Secretary Workout Log")
+
+    # 4. Remember the fingerprints now present in both files
+    master_entries = dict(master_entries)
+    monthly_entries = dict(monthly_entries)
+    if not in_master:
+        master_entries[entry_hash] = now
+    if not in_monthly:
+        monthly_entries[entry_hash] = now
+    cache['dates'][date_str] = {
+        h: min(t, monthly_entries[h]).strftime('%Y-%m-%dT%H:%M:%S')
+        for h, t in master_entries.items() if h in monthly_entries
+    }
+    cache['files'][MASTER_FILE] = _file_signature(MASTER_FILE)
+    cache['files'][monthly_file] = _file_signature(monthly_file)
+    _write_hash_cache(cache)
     
-    return success_master and success_monthly
+    return True, success_master and success_monthly
 
 def overwrite_log(date_str, content):
     """
     Wrapper to overwrite log in Master file, Monthly file, and Recent file.
     """
+    now = datetime.now().replace(microsecond=0)
+    entry_hash = fingerprint_entry(content)
+    content = _mark_entry(content, entry_hash, now)
+
     # 1. Overwrite in Master
     success_master = _overwrite_in_file(MASTER_FILE, date_str, content, title="Iron Secretary Workout Log")
     
@@ -90,6 +295,13 @@ def overwrite_log(date_str, content):
     # But _update_recent_workouts re-builds the list.
     _update_recent_workouts(date_str, content)
 
+    # 4. The date now holds only this entry
+    cache = _load_hash_cache()
+    cache['dates'][date_str] = {entry_hash: now.strftime('%Y-%m-%dT%H:%M:%S')}
+    cache['files'][MASTER_FILE] = _file_signature(MASTER_FILE)
+    cache['files'][monthly_file] = _file_signature(monthly_file)
+    _write_hash_cache(cache)
+
     return success_master and success_monthly
 
 def _update_recent_workouts(date_str, content):
@@ -316,3 +528,75 @@ def _overwrite_in_file(file_path, date_str, content, title="Workout Log"):
     # Now save as new
     return _save_to_file(file_path, date_str, content, title=title)
 
+
+def _dedupe_file(file_path):
+    """
+    Internal function: Removes entries repeated within DUPLICATE_WINDOW of an identical
+    entry in the same date section. The file is streamed into a temp file and only
+    replaced if something was removed.
+    Returns the number of removed entries.
+    """
+    kept = {}
+    removed = 0
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as out:
+        # Blank lines are held back so runs collapse to one and none trail at EOF,
+        # matching what _save_to_file writes.
+        pending_blank = False
+        wrote_any = False
+        for entry_date, lines, is_entry in _iter_entries(file_path):
+            if is_entry and entry_date is not None:
+                entry_hash, saved_at = _entry_key(lines, entry_date)
+                if saved_at is not None:
+                    kept_times = kept.setdefault((entry_date, entry_hash), [])
+                    if any(abs(saved_at - t) <= DUPLICATE_WINDOW for t in kept_times):
+                        removed += 1
+                        continue
+                    kept_times.append(saved_at)
+            for line in lines:
+                if not line.strip():
+                    pending_blank = wrote_any
+                    continue
+                if pending_blank:
+                    out.write("\n")
+                    pending_blank = False
+                out.write(line if line.endswith("\n") else line + "\n")
+                wrote_any = True
+
+    if removed:
+        os.replace(tmp_path, file_path)
+    else:
+        os.remove(tmp_path)
+    return removed
+
+def dedupe_logs():
+    """
+    Maintenance: Strips duplicate saves from the Master file and all Monthly files,
+    then drops the fingerprint cache so it is rebuilt from the cleaned files.
+    Run only while the bot is stopped, otherwise a concurrent save can be lost.
+    Returns {file_path: removed_count} for files that changed.
+    """
+    results = {}
+    files = [MASTER_FILE] + sorted(glob.glob(os.path.join(LOGS_DIR, '*.md')))
+    for file_path in files:
+        if not os.path.exists(file_path):
+            continue
+        removed = _dedupe_file(file_path)
+        if removed:
+            results[file_path] = removed
+
+    if os.path.exists(HASH_CACHE_FILE):
+        os.remove(HASH_CACHE_FILE)
+    return results
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'dedupe':
+        results = dedupe_logs()
+        if not results:
+            print("✅ 중복 기록이 없습니다.")
+        for path, count in results.items():
+            print(f"🧹 {path}: 중복 {count}건 제거")
+    else:
+        print(f"Usage: python {os.path.basename(__file__)} dedupe")